@@ -20,6 +20,8 @@ import numpy as np
 
 from biodetectron.eval import BboxPredictor as BboxDetectron
 
+from bbox_transport import pack_bboxes
+
 
 # filetypes to read with bioformates/imread (nd2 or tiff)
 BF_ENDINGS = ['nd2']
@@ -129,6 +131,12 @@ class MulticlassDetectionWorkerMRCNN:
         self.bboxpred = BboxPredictor(weight_dir)
 
     def __call__(self, img_path, existing_ds=4, filt=None, label_export_path=None):
+        return self.detect_with_scores(img_path, existing_ds, filt, label_export_path)[0]
+
+    def detect_with_scores(self, img_path, existing_ds=4, filt=None, label_export_path=None):
+        """
+        returns the result of __call__ plus class ids and scores of the boxes (in order of the result)
+        """
         try:
 
             if img_path.split('.')[-1] in BF_ENDINGS:
@@ -163,18 +171,23 @@ class MulticlassDetectionWorkerMRCNN:
 
             # build list of boxes for each class
             res = {}
+            labels = []
+            scores = []
             for cl in classes:
+                cl_scores = {tuple(r.bbox): r.score for r in boxes if r.class_id == cl}
                 res[cl] = [r.bbox for r in boxes if r.class_id == cl]
                 res[cl] = self.bboxpred.check_iou(res[cl])
+                labels += [cl] * len(res[cl])
+                scores += [float(cl_scores.get(tuple(b), np.nan)) for b in res[cl]]
                 # flip xy
                 res[cl] = [(float(b[1]), float(b[0]), float(b[3]), float(b[2])) for b in res[cl]]
 
-            return res
+            return res, labels, scores
 
 
         except Exception as e:
             traceback.print_exc()
-            return []
+            return [], [], []
 
 
 class DetectionWorkerDetectron:
@@ -182,6 +195,12 @@ class DetectionWorkerDetectron:
         self.bboxpred = BboxDetectron(cfg_dir)
 
     def __call__(self, img_path, existing_ds=4, filt=None, label_export_path=None):
+        return self.detect_with_scores(img_path, existing_ds, filt, label_export_path)[0]
+
+    def detect_with_scores(self, img_path, existing_ds=4, filt=None, label_export_path=None):
+        """
+        returns the result of __call__ plus class ids and scores of the boxes (in order of the result)
+        """
         try:
 
             if img_path.split('.')[-1] in BF_ENDINGS:
@@ -206,16 +225,38 @@ class DetectionWorkerDetectron:
 
             # flip xy
             new_boxes = []
-            for box in boxes:
+            new_classes = []
+            new_scores = []
+            for (box, cl, score) in zip(boxes, classes, scores):
                 if not np.any(np.asarray(box) < 23):
                     if not box[2] > img.shape[1] and not box[3] > img.shape[0]:
                         new_boxes.append([float(box[1]), float(box[0]), float(box[3]), float(box[2])])
+                        new_classes.append(int(cl))
+                        new_scores.append(float(score))
 
-            return new_boxes
+            return new_boxes, new_classes, new_scores
 
         except Exception as e:
             traceback.print_exc()
-            return []
+            return [], [], []
+
+
+class PackedResultWorker:
+    """
+    wrap a detection worker to return its result packed into a single binary buffer
+    (decode on the client with bbox_transport.unpack_bboxes)
+    layout is the layout of the worker's results, one of bbox_transport.LAYOUTS
+    class ids and scores are included for workers that provide detect_with_scores
+    """
+    def __init__(self, worker, layout):
+        self.worker = worker
+        self.layout = layout
+
+    def __call__(self, img_path, existing_ds=4, filt=None, label_export_path=None):
+        if hasattr(self.worker, 'detect_with_scores'):
+            res, labels, scores = self.worker.detect_with_scores(img_path, existing_ds, filt, label_export_path)
+            return pack_bboxes(res, self.layout, labels, scores)
+        return pack_bboxes(self.worker(img_path, existing_ds, filt, label_export_path), self.layout)
 
 
 def main():
@@ -230,13 +271,21 @@ def main():
     server = SimpleXMLRPCServer((get_ip(args.interface if args.interface else 'eth0'), int(args.port if args.port else 8000)))
 
     if args.model == 'rcnn':
-        server.register_function(DetectionWorkerMRCNN(args.net_dir), "detect_bbox")
+        worker = DetectionWorkerMRCNN(args.net_dir)
+        layout = 'flat'
     elif args.model == 'multiclass':
-        server.register_function(MulticlassDetectionWorkerMRCNN(args.net_dir), "detect_bbox")
+        worker = MulticlassDetectionWorkerMRCNN(args.net_dir)
+        layout = 'per_class'
     elif args.model == 'detectron':
-        server.register_function(DetectionWorkerDetectron(args.net_dir), "detect_bbox")
+        worker = DetectionWorkerDetectron(args.net_dir)
+        layout = 'flat'
     else:
-        server.register_function(DetectionWorker(args.net_dir), "detect_bbox")
+        worker = DetectionWorker(args.net_dir)
+        layout = 'per_image'
+
+    # default: plain XML-RPC structures, opt-in: packed binary result
+    server.register_function(worker, "detect_bbox")
+    server.register_function(PackedResultWorker(worker, layout), "detect_bbox_binary")
 
     try:
         server.serve_forever()
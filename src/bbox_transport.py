@@ -0,0 +1,129 @@
+import struct
+from xmlrpc.client import Binary
+
+import numpy as np
+
+
+# header of packed results: magic, format version, number of boxes, number of coordinates per box (little endian)
+# 16 bytes, so the records following it are 8-byte aligned
+PACKED_MAGIC = b'WSBB'
+PACKED_VERSION = 1
+PACKED_HEADER = struct.Struct('<4sIII')
+
+# layouts of the results returned by the detection workers
+# flat: list of boxes (rcnn, detectron)
+# per_image: list of lists of boxes, one list per image in the stack (unet)
+# per_class: dict class_id -> list of boxes (multiclass)
+LAYOUTS = ['flat', 'per_image', 'per_class']
+
+# coordinates per box if a result contains no boxes
+DEFAULT_BOX_WIDTH = 4
+
+
+def packed_dtype(box_width):
+    """
+    dtype of one packed record: bbox coordinates as returned by the worker, label and score
+    label is the class id if the worker provides it (or for per_class results), the index of the image for
+    per_image results and 0 otherwise
+    score is NaN if the worker does not provide scores
+    """
+    return np.dtype([('bbox', '<f8', (box_width,)), ('label', '<i4'), ('score', '<f4')])
+
+
+def pack_bboxes(res, layout='flat', labels=None, scores=None):
+    """
+    pack a detection result into a single typed buffer for transport via XML-RPC
+
+    Parameters
+    ----------
+    res: list or dict
+        result of one of the detection workers
+    layout: str
+        layout of res, one of LAYOUTS
+    labels: list of int, optional
+        class id of every box in res (in order of res), overrides the labels derived from the layout
+    scores: list of float, optional
+        score of every box in res (in order of res)
+
+    Returns
+    -------
+    packed: xmlrpc.client.Binary
+        header followed by the records as packed_dtype(box_width)
+    """
+
+    if layout not in LAYOUTS:
+        raise ValueError('unknown result layout: {}'.format(layout))
+
+    # NB: workers return an empty list on error, regardless of layout
+    if len(res) == 0:
+        groups = []
+    elif layout == 'per_class':
+        groups = [(int(k), v) for (k, v) in res.items()]
+    elif layout == 'per_image':
+        groups = list(enumerate(res))
+    else:
+        groups = [(0, res)]
+
+    arrs = []
+    for (label, boxes) in groups:
+        if len(boxes) == 0:
+            continue
+        arr = np.asarray(boxes, dtype=np.float64)
+        if arr.ndim != 2 or arr.shape[0] != len(boxes):
+            raise ValueError('result does not match layout {}'.format(layout))
+        arrs.append((label, arr))
+
+    box_widths = set(arr.shape[1] for (_, arr) in arrs)
+    if len(box_widths) > 1:
+        raise ValueError('boxes of differing dimensionality in result: {}'.format(sorted(box_widths)))
+    box_width = box_widths.pop() if box_widths else DEFAULT_BOX_WIDTH
+
+    n = sum(len(arr) for (_, arr) in arrs)
+    records = np.empty(n, dtype=packed_dtype(box_width))
+    records['score'] = np.nan
+
+    i = 0
+    for (label, arr) in arrs:
+        records['bbox'][i:i + len(arr)] = arr
+        records['label'][i:i + len(arr)] = label
+        i += len(arr)
+
+    for (name, values) in (('label', labels), ('score', scores)):
+        if values is None:
+            continue
+        if len(values) != n:
+            raise ValueError('got {} {}s for {} boxes'.format(len(values), name, n))
+        records[name] = values
+
+    return Binary(PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, n, box_width) + records.tobytes())
+
+
+def unpack_bboxes(packed):
+    """
+    decode the result of pack_bboxes without copying the box data
+
+    Parameters
+    ----------
+    packed: xmlrpc.client.Binary or bytes-like
+        packed detection result as returned by detect_bbox_binary
+
+    Returns
+    -------
+    bboxes: (n, box_width) array of float64
+    labels: (n,) array of int32
+    scores: (n,) array of float32
+        read-only views into the received buffer
+    """
+
+    buf = memoryview(packed.data if isinstance(packed, Binary) else packed)
+
+    if len(buf) < PACKED_HEADER.size:
+        raise ValueError('packed result too short')
+    magic, version, n, box_width = PACKED_HEADER.unpack_from(buf)
+    if magic != PACKED_MAGIC:
+        raise ValueError('not a packed detection result')
+    if version != PACKED_VERSION:
+        raise ValueError('unsupported packed result version {}'.format(version))
+
+    records = np.frombuffer(buf, dtype=packed_dtype(box_width), count=n, offset=PACKED_HEADER.size)
+    return records['bbox'], records['label'], records['score']
@@ -0,0 +1,577 @@
+"""
+offline benchmarks for detection, folder watching, stitching, projection and cleanup
+
+everything runs on synthetic data in a temporary directory: detection models are replaced by stub predictors,
+Fiji is replaced by a stand-in executable that mosaics the tiles of a synthetic tile grid.
+the real server, watcher, stitching and projection code is used for everything else.
+
+NB: the detection benchmark still needs the model packages installed, autodetect imports them,
+stitching, projection, watcher and cleanup need the projection submodule (autostitch imports it)
+
+results are written as JSON, use --baseline to compare against the report of a previous version
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import stat
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+import subprocess
+import threading
+import tracemalloc
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from xmlrpc.client import ServerProxy
+from xmlrpc.server import SimpleXMLRPCServer
+
+import numpy as np
+from skimage.external.tifffile import imread, imsave
+
+from bbox_transport import unpack_bboxes
+
+# NB: autodetect, autostitch and projection are imported in the benchmarks that need them
+
+# stand-in for the Fiji executable, called as: fiji --headless -macro <macro> '<raw_dir> ...'
+# mosaics all tiles tile_<row>_<col>_ch<channel>.tif in raw_dir into one image per channel in raw_dir_stitched
+FAKE_FIJI = '''#!{python}
+import os
+import re
+import sys
+
+import numpy as np
+from skimage.external.tifffile import imread, imsave
+
+raw_dir = sys.argv[-1].split(' ')[0]
+tiles = {{}}
+for f in os.listdir(raw_dir):
+    m = re.match(r'tile_(\\d+)_(\\d+)_ch(\\d+)\\.tif', f)
+    if m:
+        tiles[tuple(int(g) for g in m.groups())] = os.path.join(raw_dir, f)
+
+for ch in sorted(set(k[2] for k in tiles)):
+    rows = max(k[0] for k in tiles if k[2] == ch) + 1
+    cols = max(k[1] for k in tiles if k[2] == ch) + 1
+    mosaic = np.block([[imread(tiles[(r, c, ch)]) for c in range(cols)] for r in range(rows)])
+    imsave(os.path.join(raw_dir + '_stitched', 'ch{{}}.tif'.format(ch)), mosaic)
+print('stitched {{}} tiles'.format(len(tiles)))
+'''
+
+
+@contextlib.contextmanager
+def log_level(name, level):
+    """
+    temporarily set the level of a logger
+    """
+    logger = logging.getLogger(name)
+    old_level = logger.level
+    logger.setLevel(level)
+    try:
+        yield
+    finally:
+        logger.setLevel(old_level)
+
+
+def stats(times):
+    times = np.asarray(times)
+    return {'mean_s': float(np.mean(times)),
+            'median_s': float(np.median(times)),
+            'p95_s': float(np.percentile(times, 95)),
+            'min_s': float(np.min(times))}
+
+
+def synthetic_image(rng, shape, n_blobs=50, sigma=None):
+    """
+    uint16 image of gaussian blobs on a noisy background
+    sigma controls the blob size, the larger it is, the more out of focus the image looks
+    """
+    sigma = max(shape) / 100 if sigma is None else sigma
+    yy, xx = np.mgrid[0:shape[0], 0:shape[1]]
+    img = rng.normal(1000, 50, shape)
+    for (y, x) in zip(rng.uniform(0, shape[0], n_blobs), rng.uniform(0, shape[1], n_blobs)):
+        img += 10000 * np.exp(-((yy - y) ** 2 + (xx - x) ** 2) / (2 * sigma ** 2))
+    return np.clip(img, 0, 65535).astype(np.uint16)
+
+
+def write_tile_grid(rng, path, grid, tile_shape, channels):
+    os.makedirs(path)
+    for r in range(grid[0]):
+        for c in range(grid[1]):
+            for ch in range(channels):
+                imsave(os.path.join(path, 'tile_{}_{}_ch{}.tif'.format(r, c, ch)), synthetic_image(rng, tile_shape))
+
+
+def make_fake_fiji(path):
+    with open(path, 'w') as fd:
+        fd.write(FAKE_FIJI.format(python=sys.executable))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+# stub detection models, as passed to --models, with the layout of their results
+# rcnn runs the real DetectionWorkerMRCNN code with a stub predictor,
+# the others return synthetic results in the shape of the respective worker
+MODEL_LAYOUTS = {'rcnn': 'flat', 'detectron': 'flat', 'unet': 'per_image', 'multiclass': 'per_class'}
+
+# images/classes the stub boxes are spread over for per_image/per_class results
+STUB_GROUPS = 3
+
+
+class StubBboxPredictor:
+    """
+    replaces the MRCNN BboxPredictor: returns a fixed set of boxes, optionally after a delay
+    """
+    def __init__(self, boxes, delay=0.0):
+        self.boxes = boxes
+        self.delay = delay
+
+    def predict_bbox(self, img):
+        if self.delay > 0:
+            time.sleep(self.delay)
+        return self.boxes
+
+
+class StubResultWorker:
+    """
+    replaces the detectron/unet/multiclass workers: reads the image and returns a fixed set of boxes
+    in the shape of the respective worker, optionally after a delay
+    """
+    def __init__(self, model, boxes, labels, delay=0.0):
+        self.model = model
+        self.boxes = boxes
+        self.labels = labels
+        self.delay = delay
+
+    def __call__(self, img_path, existing_ds=4, filt=None, label_export_path=None):
+        imread(img_path)
+        if self.delay > 0:
+            time.sleep(self.delay)
+
+        if self.model == 'detectron':
+            return [[float(c) for c in b] for b in self.boxes]
+        elif self.model == 'unet':
+            return [[tuple(int(c) for c in b) for b in self.boxes[self.labels == i]] for i in range(STUB_GROUPS)]
+        else:
+            return {int(cl): [tuple(float(c) for c in b) for b in self.boxes[self.labels == cl]]
+                    for cl in np.unique(self.labels)}
+
+
+class StubScoredResultWorker(StubResultWorker):
+    """
+    replaces the detectron/multiclass workers, which also provide class ids and scores
+    """
+    def __init__(self, model, boxes, labels, scores, delay=0.0):
+        super().__init__(model, boxes, labels, delay)
+        self.scores = scores
+
+    def detect_with_scores(self, img_path, existing_ds=4, filt=None, label_export_path=None):
+        res = self(img_path, existing_ds, filt, label_export_path)
+        return res, [int(l) for l in self.labels], [float(sc) for sc in self.scores]
+
+
+def stub_worker(model, n_boxes, img_shape, delay, rng):
+    """
+    build a stub worker for the given model
+
+    Returns
+    -------
+    worker: callable
+        stub worker
+    expected_boxes: (n_boxes, 4) array
+    expected_labels: (n_boxes,) array
+    expected_scores: (n_boxes,) array
+        boxes, labels and scores the decoded packed results of the worker should contain, in that order
+    """
+    from autodetect import DetectionWorkerMRCNN
+
+    mins = np.floor(rng.uniform(0, 1, (n_boxes, 2)) * np.array(img_shape))
+    sizes = np.floor(rng.uniform(5, 50, (n_boxes, 2)))
+    boxes = np.concatenate([mins, mins + sizes], axis=1)
+
+    if model == 'rcnn':
+        worker = DetectionWorkerMRCNN.__new__(DetectionWorkerMRCNN)
+        worker.bboxpred = StubBboxPredictor(boxes, delay)
+        # the worker flips xy, rcnn provides neither classes nor scores
+        return worker, boxes[:, [1, 0, 3, 2]], np.zeros(n_boxes, dtype=np.int32), np.full(n_boxes, np.nan)
+
+    # sorted, so boxes are in packing order
+    labels = np.sort(rng.randint(0, STUB_GROUPS, n_boxes)).astype(np.int32)
+    scores = rng.uniform(0, 1, n_boxes).astype(np.float32)
+
+    if model == 'unet':
+        return StubResultWorker(model, boxes, labels, delay), boxes, labels, np.full(n_boxes, np.nan)
+    return StubScoredResultWorker(model, boxes, labels, scores, delay), boxes, labels, scores
+
+
+def check_detection(proxy, img_path, layout, expected_boxes, expected_labels, expected_scores):
+    """
+    check the results of detect_bbox and detect_bbox_binary against the boxes returned by the stub worker
+    """
+    bboxes, labels, scores = unpack_bboxes(proxy.detect_bbox_binary(img_path, 4))
+    if not (np.array_equal(bboxes, expected_boxes) and np.array_equal(labels, expected_labels)
+            and np.array_equal(scores, expected_scores.astype(np.float32), equal_nan=True)):
+        raise RuntimeError('detect_bbox_binary returned wrong boxes, labels or scores')
+
+    # NB: XML-RPC structs need string keys, so the per-class dicts cannot be sent via detect_bbox
+    if layout == 'per_class':
+        return
+    res = proxy.detect_bbox(img_path, 4)
+    if layout == 'per_image':
+        res = [b for group in res for b in group]
+    if not np.array_equal(np.asarray(res, dtype=np.float64).reshape((-1, 4)), expected_boxes):
+        raise RuntimeError('detect_bbox returned wrong boxes')
+
+
+def bench_detection(args, rng, tmpdir):
+    from autodetect import PackedResultWorker
+
+    img_shape = (args.overview_size, args.overview_size)
+    img_path = os.path.join(tmpdir, 'overview.tif')
+    imsave(img_path, synthetic_image(rng, img_shape))
+
+    results = {}
+    for model in args.models:
+        layout = MODEL_LAYOUTS[model]
+        for n_boxes in args.boxes:
+            server = SimpleXMLRPCServer(('127.0.0.1', 0), logRequests=False)
+            worker, *expected = stub_worker(model, n_boxes, img_shape, args.model_delay, rng)
+            server.register_function(worker, 'detect_bbox')
+            server.register_function(PackedResultWorker(worker, layout), 'detect_bbox_binary')
+            url = 'http://127.0.0.1:{}/'.format(server.server_address[1])
+            server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+            server_thread.start()
+
+            def request(binary):
+                with ServerProxy(url) as proxy:
+                    t0 = time.perf_counter()
+                    if binary:
+                        bboxes, _, _ = unpack_bboxes(proxy.detect_bbox_binary(img_path, 4))
+                    else:
+                        bboxes = proxy.detect_bbox(img_path, 4)
+                    dt = time.perf_counter() - t0
+                if len(bboxes) == 0 and n_boxes > 0:
+                    raise RuntimeError('detection failed')
+                return dt
+
+            try:
+                with ServerProxy(url) as proxy:
+                    check_detection(proxy, img_path, layout, *expected)
+
+                for binary in ((True,) if layout == 'per_class' else (False, True)):
+                    for concurrency in args.concurrency:
+                        n_requests = args.requests * concurrency
+                        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                            t0 = time.perf_counter()
+                            latencies = list(pool.map(request, [binary] * n_requests))
+                            total = time.perf_counter() - t0
+                        res = stats(latencies)
+                        res['requests_per_s'] = n_requests / total
+                        key = '{}/{}/boxes={}/concurrency={}'.format(model, 'binary' if binary else 'plain',
+                                                                     n_boxes, concurrency)
+                        results[key] = res
+                        logging.info('detection {}: {:.1f} requests/s'.format(key, res['requests_per_s']))
+            finally:
+                server.shutdown()
+                server.server_close()
+    return results
+
+
+def bench_watcher(args, rng, tmpdir):
+    from autostitch import FolderWatcher
+
+    results = {}
+    for n_files in args.watch_files:
+        watch_dir = os.path.join(tmpdir, 'watch_{}'.format(n_files))
+        os.makedirs(watch_dir)
+        for i in range(n_files):
+            open(os.path.join(watch_dir, 'file_{}.nd2'.format(i)), 'w').close()
+            # every tenth file is still locked
+            if i % 10 == 0:
+                open(os.path.join(watch_dir, 'file_{}.nd2.lock'.format(i)), 'w').close()
+
+        found = {}
+        callback = lambda f: found.setdefault(f, time.perf_counter())
+        watcher = FolderWatcher(watch_dir, callback, endings=['nd2'], ignore_existing=True)
+        watcher._start()
+
+        # cost of one polling pass without changes
+        scan_times = []
+        for _ in range(args.repeats):
+            t0 = time.perf_counter()
+            watcher._check_new()
+            scan_times.append(time.perf_counter() - t0)
+
+        # time from a new file appearing to the callback, for one polling pass
+        detect_times = []
+        for i in range(args.repeats):
+            new_file = os.path.join(watch_dir, 'new_{}.nd2'.format(i))
+            open(new_file, 'w').close()
+            t0 = time.perf_counter()
+            watcher._check_new()
+            watcher._process_changes()
+            if new_file not in found:
+                raise RuntimeError('watcher missed {}'.format(new_file))
+            detect_times.append(found[new_file] - t0)
+
+        res = {'scan': stats(scan_times), 'detect': stats(detect_times)}
+        # a new file waits for at most one check interval, plus the polling pass itself
+        res['worst_case_latency_s'] = watcher.check_interval + res['detect']['median_s']
+        results['files={}'.format(n_files)] = res
+        logging.info('watcher files={}: scan {:.4f}s'.format(n_files, res['scan']['median_s']))
+    return results
+
+
+def bench_stitching(args, rng, tmpdir):
+    from autostitch import AsyncFileProcesser
+
+    fiji = os.path.join(tmpdir, 'fake-fiji')
+    make_fake_fiji(fiji)
+    macro = os.path.join(os.path.abspath(__file__).rsplit(os.sep, 2)[0], 'res', 'stitch.ijm')
+    tile_shape = (args.tile_size, args.tile_size)
+
+    results = {}
+    for num_workers in args.concurrency:
+        raw_dirs = []
+        for i in range(args.stitch_jobs):
+            raw_dir = os.path.join(tmpdir, 'stitch_{}'.format(num_workers), 'raw', 'grid_{}'.format(i))
+            write_tile_grid(rng, raw_dir, (args.grid, args.grid), tile_shape, args.channels)
+            raw_dirs.append(raw_dir)
+
+        processor = AsyncFileProcesser(fiji, macro, num_workers=num_workers)
+        t0 = time.perf_counter()
+        for raw_dir in raw_dirs:
+            processor(raw_dir, project=True)
+        # quit waits for all submitted jobs
+        processor.quit()
+        total = time.perf_counter() - t0
+
+        # errors in the worker threads are not propagated, check the outputs instead
+        done = [d for d in raw_dirs if os.path.exists(d.replace('raw', 'projected') + '_projected.tif')]
+        if len(done) != len(raw_dirs):
+            raise RuntimeError('{} of {} stitching jobs failed'.format(len(raw_dirs) - len(done), len(raw_dirs)))
+
+        results['workers={}'.format(num_workers)] = {'total_s': total, 'jobs_per_s': len(raw_dirs) / total}
+        logging.info('stitching workers={}: {:.2f} jobs/s'.format(num_workers, len(raw_dirs) / total))
+    return results
+
+
+def bench_projection(args, rng, tmpdir):
+    from projection import ProjectorApplication
+
+    app = ProjectorApplication()
+    results = {}
+    for size in args.projection_sizes:
+        infiles = []
+        for plane in range(args.planes):
+            # blob size varies with distance from the focal plane
+            sigma = size / 200 * (1 + abs(plane - args.planes // 2))
+            infile = os.path.join(tmpdir, 'projection_{}'.format(size), 'plane_{}.tif'.format(plane))
+            os.makedirs(os.path.dirname(infile), exist_ok=True)
+            imsave(infile, synthetic_image(rng, (size, size), sigma=sigma))
+            infiles.append(infile)
+        outbase = os.path.join(tmpdir, 'projection_{}'.format(size), 'out', 'proj')
+
+        times = []
+        for _ in range(args.repeats):
+            t0 = time.perf_counter()
+            app._project(app.projector, infiles, outbase)
+            times.append(time.perf_counter() - t0)
+
+        # separate run for memory, tracing slows down allocations
+        tracemalloc.start()
+        app._project(app.projector, infiles, outbase)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        res = stats(times)
+        res['peak_mb'] = peak / 2 ** 20
+        results['size={}/planes={}'.format(size, args.planes)] = res
+        logging.info('projection size={}: {:.3f}s, {:.1f}MB'.format(size, res['median_s'], res['peak_mb']))
+    return results
+
+
+def bench_cleanup(args, rng, tmpdir):
+    from autostitch import handle_cleanup, STITCHER_ENDING
+
+    results = {}
+    for size_mb in args.cleanup_sizes:
+        n_bytes = int(size_mb * 2 ** 20)
+        data = [rng.bytes(n_bytes) for _ in range(args.channels)]
+
+        times = []
+        delete_times = []
+        for i in range(args.repeats):
+            stitching_path = os.path.join(tmpdir, 'cleanup_{}'.format(size_mb), 'stitched_{}'.format(i))
+            outpaths = [os.path.join(tmpdir, 'cleanup_{}'.format(size_mb), 'out_{}_{}'.format(i, ch))
+                        for ch in range(args.channels)]
+            os.makedirs(stitching_path)
+            for (ch, d) in enumerate(data):
+                with open(os.path.join(stitching_path, 'ch{}{}'.format(ch, STITCHER_ENDING)), 'wb') as fd:
+                    fd.write(d)
+            for p in outpaths:
+                os.makedirs(p)
+
+            t0 = time.perf_counter()
+            handle_cleanup(stitching_path, outpaths, delete_raw=False, delete_stitching=False)
+            times.append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            shutil.rmtree(stitching_path)
+            delete_times.append(time.perf_counter() - t0)
+
+        res = stats(times)
+        res['copy_mb_per_s'] = size_mb * args.channels / res['median_s']
+        res['delete'] = stats(delete_times)
+        results['size_mb={}/files={}'.format(size_mb, args.channels)] = res
+        logging.info('cleanup size_mb={}: {:.1f}MB/s'.format(size_mb, res['copy_mb_per_s']))
+    return results
+
+
+BENCHMARKS = {
+    'detection': bench_detection,
+    'watcher': bench_watcher,
+    'stitching': bench_stitching,
+    'projection': bench_projection,
+    'cleanup': bench_cleanup,
+}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              universal_newlines=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def flatten(d, prefix=''):
+    """
+    flatten nested dict of results to {'section/key/metric': value}
+    """
+    res = {}
+    for (k, v) in d.items():
+        if isinstance(v, dict):
+            res.update(flatten(v, prefix + k + '/'))
+        else:
+            res[prefix + k] = v
+    return res
+
+
+def compare(baseline, report):
+    """
+    print metrics of report relative to a baseline report
+    """
+    old = flatten(baseline['results'])
+    new = flatten(report['results'])
+    print('{:<70} {:>12} {:>12} {:>8}'.format('metric', 'baseline', 'current', 'ratio'))
+    for k in sorted(set(old) & set(new)):
+        ratio = new[k] / old[k] if old[k] else float('nan')
+        print('{:<70} {:>12.4g} {:>12.4g} {:>8.2f}'.format(k, old[k], new[k], ratio))
+
+
+def main():
+
+    int_list = lambda s: [int(x) for x in s.split(',')]
+    float_list = lambda s: [float(x) for x in s.split(',')]
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-o', '--output', help='path of the JSON report to write', default='benchmark.json')
+    parser.add_argument('-b', '--baseline', help='JSON report of a previous run to compare to')
+    parser.add_argument('--only', help='run only the given benchmarks (comma-separated list of {})'.format(
+        ','.join(BENCHMARKS)))
+    parser.add_argument('--seed', help='random seed for synthetic data', type=int, default=0)
+    parser.add_argument('--repeats', help='repetitions per measurement', type=int, default=5)
+    parser.add_argument('--concurrency', help='client threads/stitching workers (comma-separated list)',
+                        type=int_list, default=[1, 2, 4, 8])
+    parser.add_argument('--requests', help='detection requests per client thread', type=int, default=5)
+    parser.add_argument('--models', help='stub models to serve (comma-separated list of {}), '.format(
+        ','.join(MODEL_LAYOUTS)) + 'the detection benchmark needs the model packages installed',
+                        type=lambda s: s.split(','), default=list(MODEL_LAYOUTS))
+    parser.add_argument('--boxes', help='boxes returned by the stub model (comma-separated list)',
+                        type=int_list, default=[100, 1000, 10000])
+    parser.add_argument('--model-delay', help='seconds the stub model takes per image', type=float, default=0.0)
+    parser.add_argument('--overview-size', help='edge length of the synthetic overview image', type=int, default=1024)
+    parser.add_argument('--watch-files', help='files in the watched directory (comma-separated list)',
+                        type=int_list, default=[100, 1000, 5000])
+    parser.add_argument('--stitch-jobs', help='tile grids to stitch per concurrency level', type=int, default=8)
+    parser.add_argument('--grid', help='rows/columns of the synthetic tile grids', type=int, default=3)
+    parser.add_argument('--tile-size', help='edge length of the synthetic tiles', type=int, default=256)
+    parser.add_argument('--channels', help='channels of tile grids/files per cleanup', type=int, default=3)
+    parser.add_argument('--planes', help='planes to project', type=int, default=5)
+    parser.add_argument('--projection-sizes', help='edge length of the images to project (comma-separated list)',
+                        type=int_list, default=[512, 1024, 2048])
+    parser.add_argument('--cleanup-sizes', help='size of the files to copy in cleanup in MB (comma-separated list)',
+                        type=float_list, default=[1, 16, 64])
+    parser.add_argument('--keep', help='keep the temporary directory with synthetic data', action='store_true')
+    parser.add_argument('-d', '--debug', help='show debug output', action='store_true')
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s %(levelname)s: %(message)s',
+                        level=logging.DEBUG if args.debug else logging.INFO,
+                        datefmt='%d.%m.%Y %H:%M:%S')
+    logger = logging.getLogger(__name__)
+
+    only = args.only.split(',') if args.only else BENCHMARKS
+    for b in only:
+        if b not in BENCHMARKS:
+            parser.print_help()
+            logger.error('unknown benchmark: {}'.format(b))
+            sys.exit(1)
+
+    for m in args.models:
+        if m not in MODEL_LAYOUTS:
+            parser.print_help()
+            logger.error('unknown model: {}'.format(m))
+            sys.exit(1)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as fd:
+            baseline = json.load(fd)
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'params': {k: v for (k, v) in vars(args).items() if k not in ('output', 'baseline', 'keep', 'debug')},
+        'results': {}
+    }
+
+    rng = np.random.RandomState(args.seed)
+    tmpdir = tempfile.mkdtemp(prefix='wing-stitch-benchmark-')
+    logger.info('writing synthetic data to {}'.format(tmpdir))
+
+    try:
+        for b in BENCHMARKS:
+            if b not in only:
+                continue
+            logger.info('running {} benchmark ...'.format(b))
+            os.makedirs(os.path.join(tmpdir, b))
+            # the detection workers print for every image and the watcher logs every file, keep the output readable
+            with contextlib.redirect_stdout(io.StringIO()), \
+                    log_level('autostitch', logging.DEBUG if args.debug else logging.WARNING):
+                report['results'][b] = BENCHMARKS[b](args, rng, os.path.join(tmpdir, b))
+    finally:
+        if not args.keep:
+            shutil.rmtree(tmpdir)
+
+    with open(args.output, 'w') as fd:
+        json.dump(report, fd, indent=2)
+    logger.info('report written to {}'.format(args.output))
+
+    if baseline is not None:
+        compare(baseline, report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+import struct
+from xmlrpc.client import dumps, loads
+
+import numpy as np
+import pytest
+
+from bbox_transport import pack_bboxes, unpack_bboxes, PACKED_HEADER, PACKED_MAGIC, PACKED_VERSION
+
+
+def roundtrip(packed):
+    # send through XML-RPC marshalling as the server/client would
+    return loads(dumps((packed,), methodresponse=True))[0][0]
+
+
+def test_flat():
+    bboxes, labels, scores = unpack_bboxes(roundtrip(pack_bboxes([(1, 2, 3, 4), (5, 6, 7, 8)], 'flat')))
+    assert bboxes.tolist() == [[1, 2, 3, 4], [5, 6, 7, 8]]
+    assert labels.tolist() == [0, 0]
+    assert np.all(np.isnan(scores))
+    assert bboxes.flags.aligned
+
+
+def test_flat_list_boxes():
+    # detectron returns boxes as lists
+    bboxes, labels, _ = unpack_bboxes(roundtrip(pack_bboxes([[1., 2., 3., 4.], [5., 6., 7., 8.]], 'flat')))
+    assert bboxes.tolist() == [[1, 2, 3, 4], [5, 6, 7, 8]]
+    assert labels.tolist() == [0, 0]
+
+
+def test_per_image():
+    res = [[(1, 2, 3, 4)], [], [(5, 6, 7, 8), (0, 0, 1, 1)]]
+    bboxes, labels, _ = unpack_bboxes(roundtrip(pack_bboxes(res, 'per_image')))
+    assert bboxes.tolist() == [[1, 2, 3, 4], [5, 6, 7, 8], [0, 0, 1, 1]]
+    assert labels.tolist() == [0, 2, 2]
+
+
+def test_per_class():
+    res = {3: [(1, 2, 3, 4)], 1: [], 2: [(5, 6, 7, 8)]}
+    bboxes, labels, _ = unpack_bboxes(roundtrip(pack_bboxes(res, 'per_class')))
+    assert bboxes.tolist() == [[1, 2, 3, 4], [5, 6, 7, 8]]
+    assert labels.tolist() == [3, 2]
+
+
+def test_labels_and_scores():
+    packed = pack_bboxes([(1, 2, 3, 4), (5, 6, 7, 8)], 'flat', labels=[2, 5], scores=[0.5, 0.25])
+    _, labels, scores = unpack_bboxes(roundtrip(packed))
+    assert labels.tolist() == [2, 5]
+    assert scores.tolist() == [0.5, 0.25]
+
+
+def test_wrong_number_of_scores():
+    with pytest.raises(ValueError):
+        pack_bboxes([(1, 2, 3, 4), (5, 6, 7, 8)], 'flat', scores=[0.5])
+
+
+def test_empty_per_class():
+    # workers return an empty list on error, regardless of layout
+    bboxes, labels, scores = unpack_bboxes(roundtrip(pack_bboxes([], 'per_class')))
+    assert bboxes.shape == (0, 4)
+    assert len(labels) == 0 and len(scores) == 0
+
+
+def test_3d_boxes():
+    res = [[(0, 1, 2, 3, 4, 5)], [(6, 7, 8, 9, 10, 11)]]
+    bboxes, labels, _ = unpack_bboxes(roundtrip(pack_bboxes(res, 'per_image')))
+    assert bboxes.tolist() == [[0, 1, 2, 3, 4, 5], [6, 7, 8, 9, 10, 11]]
+    assert labels.tolist() == [0, 1]
+
+
+@pytest.mark.parametrize('res,layout', [
+    ([[(1, 2, 3, 4)]], 'flat'),
+    ([(1, 2, 3, 4)], 'per_image'),
+    ([(1, 2, 3, 4), (1, 2, 3)], 'flat'),
+    ([[(1, 2, 3, 4)], [(1, 2, 3, 4, 5, 6)]], 'per_image'),
+    ([(1, 2, 3, 4)], 'unknown'),
+])
+def test_bad_results(res, layout):
+    with pytest.raises(ValueError):
+        pack_bboxes(res, layout)
+
+
+def test_bad_magic():
+    data = pack_bboxes([(1, 2, 3, 4)]).data
+    with pytest.raises(ValueError):
+        unpack_bboxes(b'XXXX' + data[4:])
+
+
+def test_bad_version():
+    data = pack_bboxes([(1, 2, 3, 4)]).data
+    _, _, n, box_width = PACKED_HEADER.unpack_from(data)
+    header = PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION + 1, n, box_width)
+    with pytest.raises(ValueError):
+        unpack_bboxes(header + data[PACKED_HEADER.size:])
+
+
+def test_too_short():
+    with pytest.raises(ValueError):
+        unpack_bboxes(struct.pack('<4s', PACKED_MAGIC))